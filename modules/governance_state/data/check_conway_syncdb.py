@@ -1,79 +1,63 @@
 # Standalone test for Conway governance correctness checking
 # Use: check_conway_syncdb.py <dbsync-csv-output> <acropolis-conway-output>
 
+import csv
 import sys
-
-def screen_strings(header):
-    inside = False
-    prev = " "
-    out = ""
-    for ptr in range(0,len(header)):
-        if prev == '\"' and header[ptr] != '\"':
-            inside = not inside
-
-        if header[ptr] == ',' and inside:
-            out += ';'
-        else:
-            out += header[ptr]
-        prev = header[ptr]
-
-    return out
+from collections import defaultdict
+from operator import itemgetter
 
 def strip_some(s):
-    return s.removeprefix('Some(').removesuffix(')')
+    # Epoch columns are either empty/plain or 'Some(<epoch>)'
+    if not s.startswith('Some('):
+        return s
+    return s[5:-1] if s.endswith(')') else s[5:]
 
 if len(sys.argv) <= 2:
     print("\nUsage: %s <dbsync-csv-file> <acropolis-conway-output>\n" % sys.argv[0])
     exit(1)
 
-dbsync = open(sys.argv[1],'rt')
-acropolis = open(sys.argv[2],'rt')
+dbsync = open(sys.argv[1],'rt',newline='')
+acropolis = open(sys.argv[2],'rt',newline='')
 
-dbsync_dict = {}
+dbsync_dict = defaultdict(list)
 
 # First field index in header per each line: 0 7 13 23
-header = """id,tx_id,index,prev_gov_action_proposal,deposit,return_address,expiration,
-    voting_anchor_id,type,description,param_proposal,ratified_epoch,enacted_epoch,
-    dropped_epoch,expired_epoch,id,hash,block_id,block_index,out_sum,fee,deposit,size,
-    invalid_before,invalid_hereafter,valid_contract,script_size,treasury_donation"""
-header = screen_strings(header)
-hl = header.split(',')
-
-for s in dbsync:
-    sh = screen_strings(s)
-    sl = sh.strip().split(',')
-    if len(sl) != len(hl):
-        continue
-    if sl == hl:
-        continue
+hl = ('id','tx_id','index','prev_gov_action_proposal','deposit','return_address','expiration',
+      'voting_anchor_id','type','description','param_proposal','ratified_epoch','enacted_epoch',
+      'dropped_epoch','expired_epoch','id','hash','block_id','block_index','out_sum','fee','deposit','size',
+      'invalid_before','invalid_hereafter','valid_contract','script_size','treasury_donation')
+
+# Only hash, index, type and ratified/enacted/dropped/expired epochs are used
+dbsync_cols = itemgetter(16,2,8,11,12,13,14)
 
-    hhash = sl[16].strip("\\x")
+# Header rows are recognised by their first column name
+hl_len = len(hl)
+
+for sl in csv.reader(dbsync):
+    if len(sl) != hl_len or sl[0] == hl[0]:
+        continue
 
-    idx = (hhash,sl[2])
-    if idx not in dbsync_dict:
-        dbsync_dict[idx] = []
-    dbsync_dict[idx].append((sl[8],sl[11],sl[12],sl[13],sl[14]))
+    (hhash,index,ty,re,en,de,ex) = dbsync_cols(sl)
+    dbsync_dict[(hhash.strip("\\x"),index)].append((ty,re,en,de,ex))
 
-header_a = """id,start,tx_id,index,prev_gov_action_proposal,deposit,return_address,expiration,
-              voting_anchor_id,type,description,param_proposal,ratified_epoch,enacted_epoch,
-              dropped_epoch,expired_epoch"""
-al = header_a.split(',')
+al = ('id','start','tx_id','index','prev_gov_action_proposal','deposit','return_address','expiration',
+      'voting_anchor_id','type','description','param_proposal','ratified_epoch','enacted_epoch',
+      'dropped_epoch','expired_epoch')
 
 found = 0
-for s in acropolis:
-    sh = screen_strings(s)
-    sl = sh.strip().split(',')
+for sl in csv.reader(acropolis):
     if len(sl) < 14:
-        print("Rejecting:",s)
+        print("Rejecting:",sl)
         continue
-    if sl == al:
+    if sl[0] == al[0]:
         continue
 
+    # Hash join on (tx hash, action index); dbsync_dict is the build side
     idx = (sl[1],sl[2])
-    if idx not in dbsync_dict:
+    rec = dbsync_dict.get(idx)
+    if rec is None:
         print(idx," not found\n")
     else:
-        rec = dbsync_dict[idx]
         if len(rec) > 1:
             print(idx, "too many records: ",rec,"\n")
 
@@ -81,9 +65,13 @@ for s in acropolis:
         (ty,re,en,de,ex) = rec[0]
         if ty == "InfoAction":
             ty = "Information"
-        if ty != sl[8]: print (idx, "types do not match: `",ty,"` `",sl[8],"`\n")
-        if re != strip_some(sl[11]): print (idx, "re do not match: `",re,"` `",sl[11],"`\n")
-        if en != strip_some(sl[12]): print (idx, "en do not match: `",en,"` `",sl[12],"`\n")
-        if ex != strip_some(sl[14]): print (idx, "ex do not match: `",ex,"` `",sl[14],"`\n")
+        (a_ty,a_re,a_en,a_ex) = (sl[8],strip_some(sl[11]),strip_some(sl[12]),strip_some(sl[14]))
+        if (ty,re,en,ex) == (a_ty,a_re,a_en,a_ex):
+            continue
+
+        if ty != a_ty: print (idx, "types do not match: `",ty,"` `",sl[8],"`\n")
+        if re != a_re: print (idx, "re do not match: `",re,"` `",sl[11],"`\n")
+        if en != a_en: print (idx, "en do not match: `",en,"` `",sl[12],"`\n")
+        if ex != a_ex: print (idx, "ex do not match: `",ex,"` `",sl[14],"`\n")
 
 print("Total found records: ",found,"\n")
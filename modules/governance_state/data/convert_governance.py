@@ -1,6 +1,23 @@
 import base64
 import json
 import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+VOTE_SPLIT_RE = re.compile(r'vote_index: \d+ \}\), +')
+VOTE_ELEM_RE = re.compile(r'([a-zA-Z]+)\(\[([,0-9 ]+)\]\): \(.*, VotingProcedure \{ vote: (Yes|No|Abstain).*')
+EPOCH_VOTE_RE = re.compile(r'Epoch start (\d+), (gov_action1[^:]+):  \([0-9]+, .*\)  => \{(.+)\}$')
+PARAM_SET_RE = re.compile(r'acropolis_module_parameters_state: New parameter set enacted \[from epoch, params\]: \[(\d+),(.*)\]$')
+CONWAY_RE = re.compile(r'acropolis_module_governance_state::state: Conway voting, epoch (\d+) .*' +
+                       r'spos reg\. (\d+), dreps (\d+) \(no-confidence (\d+), abstain (\d+)\), committee (\d+),')
 
 key_type = {
     'ConstitutionalCommitteeKey': 3,
@@ -10,62 +27,42 @@ key_type = {
     'StakePoolKey': 2
 }
 
-def array_as_base64(keyhash):
-    bs = base64.b64encode(bytes(keyhash))
-    return bs.decode('ascii')
+# The same few thousand keys recur in every epoch snapshot
+@lru_cache(maxsize=None)
+def bytes_as_base64(keyhash):
+    return base64.b64encode(keyhash).decode('ascii')
 
-all_voters_hash = {}
+def load_json(path):
+    # orjson is optional: it parses the large per-epoch snapshots noticeably faster
+    with open(path, 'rb') as src:
+        if orjson:
+            return orjson.loads(src.read())
+        return json.load(src)
+
+def dump_json(obj):
+    if orjson:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+# Raw key hashes of everyone who voted; snapshots are filtered against it
+all_voters = set()
 
 def split_votes(vstr):
     # DRepKey([...]): ([...], VotingProcedure { vote: Yes, anchor: (...), vote_index: 0 }) ,
-    vlist = re.split(r'vote_index: \d+ \}\), +', vstr)
+    vlist = VOTE_SPLIT_RE.split(vstr)
     votes = { 'Yes': [], 'No': [], 'Abstain': [] }
+    keys = []
     for velem in vlist:
-        print(velem)
-        g = re.match(r'([a-zA-Z]+)\(\[([,0-9 ]+)\]\): \(.*, VotingProcedure \{ vote: (Yes|No|Abstain).*', velem)
+        g = VOTE_ELEM_RE.match(velem)
         if g:
-            key = array_as_base64([int(x) for x in g.group(2).split(', ')])
-            all_voters_hash[key] = 1
-            votes[g.group(3)] += [(key_type[g.group(1)], key)]
+            key = bytes(int(x) for x in g.group(2).split(', '))
+            keys.append(key)
+            votes[g.group(3)].append((key_type[g.group(1)], bytes_as_base64(key)))
+    all_voters.update(keys)
     return votes
 
-votes_src = open('execution_log.txt', 'rt')
-votes_hash = {}
-param_hash = {}
-epoch_data = []
-
-for v in votes_src:
-    g = re.match(r'.*Epoch start (\d+), (gov_action1[^:]+):  \([0-9]+, .*\)  => {(.+)}$',v)
-    if g:
-        if int(g.group(1))-1 not in votes_hash:
-            votes_hash[int(g.group(1))-1] = []
-        votes_hash[int(g.group(1))-1] += [(g.group(2), split_votes(g.group(3)))]
-
-    g = re.match(r'.*acropolis_module_parameters_state: New parameter set enacted [from epoch, params]: \[(\d+),(.*)\]$',v)
-    if g:
-        param_hash[int(g.group(1))] = g.group(2)
-
-    # acropolis_module_governance_state::state: Conway voting, epoch 508 (Conway): 
-    # spos reg. 23814460205033971, dreps 0 (no-confidence 0, abstain 0), committee 7, total 0 actions, 0 accepted
-    g = re.match(r'.*acropolis_module_governance_state::state: Conway voting, epoch (\d+) .*' +
-                 r'spos reg. (\d+), dreps (\d+) \(no-confidence (\d+), abstain (\d+)\), committee (\d+),',v)
-    if g:
-        epoch_data += [(int(g.group(1)), int(g.group(2)), int(g.group(3)), int(g.group(4)), int(g.group(5)))]
-        if g.group(6) != '7':
-            print("Wrong committee size in epoch %s: %s" % (g.group(1), g.group(6)))
-            sys.exit(1)
-
-#print(votes_hash)
-
-out_d = open('drep_state.json', 'wt')
-out_p = open('pool_state.json', 'wt')
-out_v = open('voting_state.json', 'wt')
-out_c = open('param_state.json', 'wt')
-out_e = open('epoch_pool_stats.json', 'wt')
-
 def convert_drep(ee):
-    src = open('drep/drep-%d.json' % ee, 'rt')
-    data = json.load(src)
+    data = load_json('drep/drep-%d.json' % ee)
 
     dreps_res = []
 
@@ -82,16 +79,15 @@ def convert_drep(ee):
             keyhash = drep[0]['ScriptHash']
 
         lovelace = drep[1]
-        key_b64 = array_as_base64(keyhash)
+        key = bytes(keyhash)
 
-        if key_b64 in all_voters_hash:
-            dreps_res += ["[%d,\"%s\",%s]" % (keytype, key_b64, lovelace)]
+        if key in all_voters:
+            dreps_res.append([keytype, bytes_as_base64(key), lovelace])
 
-    return (epoch+1, ','.join(dreps_res))
+    return [epoch+1, dreps_res]
 
 def convert_pool(ee):
-    src = open('pool/spo-%d.json' % ee, 'rt')
-    data = json.load(src)
+    data = load_json('pool/spo-%d.json' % ee)
 
     pool_res = []
 
@@ -103,56 +99,84 @@ def convert_pool(ee):
 
         active = pool[1]['active']
         live = pool[1]['live']
-        key_b64 = array_as_base64(keyhash)
+        key = bytes(keyhash)
 
-        if key_b64 in all_voters_hash:
-            pool_res += ["[\"%s\",%s,%s]" % (key_b64, active, live)]
+        if key in all_voters:
+            pool_res.append([bytes_as_base64(key), active, live])
 
-    return (epoch+1, ','.join(pool_res))
+    return [epoch+1, pool_res]
 
 def convert_votes(ee):
     res = []
     if ee in votes_hash:
         for (gov,vv) in votes_hash[ee]:
-            vv_yes = ",".join(["[%s,\"%s\"]" % (t,s) for (t,s) in vv['Yes']])
-            vv_no = ",".join(["[%s,\"%s\"]" % (t,s) for (t,s) in vv['No']])
-            vv_abstain = ",".join(["[%s,\"%s\"]" % (t,s) for (t,s) in vv['Abstain']])
-            res += [(ee,gov,("[%s],[%s],[%s]" % (vv_yes, vv_no, vv_abstain)))]
+            res.append([ee, gov, [vv['Yes'], vv['No'], vv['Abstain']]])
     return res
 
-out_d.write('[')
-out_p.write('[')
-out_v.write('[')
-first_d = False
-first_p = False
-first_v = False
-for ee in range(507,575):
-    if first_d: out_d.write(',')
-    first_d = True
-    if first_p: out_p.write(',')
-    first_p = True
-    out_d.write('[%d,[%s]]\n' % convert_drep(ee))
-    out_p.write('[%d,[%s]]\n' % convert_pool(ee))
-    for vv in convert_votes(ee):
-        if first_v: out_v.write(',')
-        first_v = True
-        out_v.write('[%d,\"%s\",[%s]]\n' % vv)
-
-out_d.write(']\n')
-out_p.write(']\n')
-out_v.write(']\n')
-
-out_c.write('[')
-first_c = False
-for x in param_hash.keys():
-    out_c.write('%s[%s,%s]\n' % ((',' if first_c else ''),x,param_hash[x]))
-    first_c = True
-out_c.write(']\n')
-
-out_e.write('[')
-first_e = False
-for ed in sorted(epoch_data):
-    if first_e: out_e.write(',')
-    first_e = True
-    out_e.write('[%d,%d,%d,%d,%d]\n' % ed)
-out_e.write(']\n')
+def read_line_blocks(path, block_size=1<<24):
+    # Split large blocks with str.split instead of iterating the file line by
+    # line; memory stays bounded by the block size rather than the log size
+    with open(path, 'rt') as src:
+        tail = ''
+        while block := src.read(block_size):
+            lines = (tail + block).split('\n')
+            tail = lines.pop()
+            yield lines
+        if tail:
+            yield [tail]
+
+def write_records(path, records):
+    # One record per line, written in a single call
+    with open(path, 'wt', buffering=1<<20) as out:
+        out.write('[' + ','.join(r + '\n' for r in records) + ']\n')
+
+def init_worker(voters):
+    global all_voters
+    all_voters = voters
+
+if __name__ == '__main__':
+    votes_hash = defaultdict(list)
+    param_hash = {}
+    epoch_data = []
+
+    # Patterns are unanchored at the front (log lines carry a timestamp/module
+    # prefix); each line is classified by its literal marker and only the
+    # corresponding regex is run.
+    for v in chain.from_iterable(read_line_blocks('execution_log.txt')):
+        if 'Epoch start' in v:
+            g = EPOCH_VOTE_RE.search(v)
+            if g:
+                votes_hash[int(g.group(1))-1].append((g.group(2), split_votes(g.group(3))))
+
+        elif 'New parameter set enacted' in v:
+            g = PARAM_SET_RE.search(v)
+            if g:
+                param_hash[int(g.group(1))] = g.group(2)
+
+        # acropolis_module_governance_state::state: Conway voting, epoch 508 (Conway): 
+        # spos reg. 23814460205033971, dreps 0 (no-confidence 0, abstain 0), committee 7, total 0 actions, 0 accepted
+        elif 'Conway voting, epoch' in v:
+            g = CONWAY_RE.search(v)
+            if g:
+                epoch_data += [(int(g.group(1)), int(g.group(2)), int(g.group(3)), int(g.group(4)), int(g.group(5)))]
+                if g.group(6) != '7':
+                    print("Wrong committee size in epoch %s: %s" % (g.group(1), g.group(6)))
+                    sys.exit(1)
+
+    # Epoch snapshots are independent of each other; parse them in parallel
+    epochs = range(507,575)
+    parts_d, parts_p, parts_v = [], [], []
+    with ProcessPoolExecutor(initializer=init_worker, initargs=(frozenset(all_voters),)) as ex:
+        dreps = ex.map(convert_drep, epochs)
+        pools = ex.map(convert_pool, epochs)
+
+        for (ee, drep, pool) in zip(epochs, dreps, pools):
+            parts_d.append(dump_json(drep))
+            parts_p.append(dump_json(pool))
+            parts_v += [dump_json(vv) for vv in convert_votes(ee)]
+
+    write_records('drep_state.json', parts_d)
+    write_records('pool_state.json', parts_p)
+    write_records('voting_state.json', parts_v)
+    write_records('param_state.json', ['[%s,%s]' % (x, param_hash[x]) for x in param_hash.keys()])
+    write_records('epoch_pool_stats.json', [dump_json(ed) for ed in sorted(epoch_data)])
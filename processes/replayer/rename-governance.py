@@ -1,21 +1,35 @@
-import glob
 import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
-json_files = [f for f in glob.glob('governance-logs/gov_00*.json')]
+LOG_DIR = 'governance-logs'
 
-idx = 0
-for j in sorted(json_files):
-    f = open(j)
-    data = json.load(f)
-    #data["ReceivedTxs"]["sequence"]["number"] = idx
-    #if idx > 1:
-    #    data["ReceivedTxs"]["sequence"]["previous"] = idx-1
-    #else:
-    #    data["ReceivedTxs"]["sequence"]["previous"] = None
-    f.close()
+# Set to re-sequence the ReceivedTxs messages; otherwise files are copied as-is
+TRANSFORM = False
 
-    f = open('governance-logs/%d.json' % idx, 'wt')
-    json.dump(data, f)
-    f.close()
+def convert(idx, name):
+    src = os.path.join(LOG_DIR, name)
+    dst = os.path.join(LOG_DIR, '%d.json' % idx)
+    if not TRANSFORM:
+        shutil.copyfile(src, dst)
+        return
 
-    idx += 1
\ No newline at end of file
+    with open(src) as f:
+        data = json.load(f)
+    data["ReceivedTxs"]["sequence"]["number"] = idx
+    if idx > 1:
+        data["ReceivedTxs"]["sequence"]["previous"] = idx-1
+    else:
+        data["ReceivedTxs"]["sequence"]["previous"] = None
+
+    with open(dst, 'wt') as f:
+        json.dump(data, f)
+
+json_files = sorted(e.name for e in os.scandir(LOG_DIR)
+                    if e.name.startswith('gov_00') and e.name.endswith('.json'))
+
+# Files are independent, so overlap their I/O
+with ThreadPoolExecutor(max_workers=32) as ex:
+    for _ in ex.map(convert, range(len(json_files)), json_files):
+        pass
@@ -29,15 +29,24 @@ from pathlib import Path
 from datetime import datetime, timezone
 
 
-def compute_sha256(file_path: Path, chunk_size: int = 16 * 1024 * 1024) -> str:
-    """Compute SHA256 hash of file using streaming to avoid large memory usage."""
-    hasher = hashlib.sha256()
+def compute_sha256(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Compute SHA256 hash of file using streaming to avoid large memory usage.
+
+    Uses hashlib.file_digest on Python 3.11+; older interpreters read into a
+    single reusable buffer so no per-chunk bytes objects are allocated.
+    """
     with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+        hasher = hashlib.sha256()
+        buf = bytearray(chunk_size)
+        view = memoryview(buf)
         while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
+            n = f.readinto(buf)
+            if not n:
                 break
-            hasher.update(chunk)
+            hasher.update(view[:n])
     return hasher.hexdigest()
 
 
@@ -7,25 +7,86 @@ This is independent of VS Code and validates the full MCP handshake.
 """
 
 import json
+import re
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads = orjson.loads if orjson else json.loads
+
 MCP_URL = "http://127.0.0.1:4341/mcp"
 HEADERS = {
     "Content-Type": "application/json",
     "Accept": "application/json, text/event-stream"
 }
 
+# Tools that don't need meaningful parameters: 'latest' anywhere in the name
+# (any case), or exactly get_epoch_info
+_TOOL_HINT_RE = re.compile(r'get_epoch_info\Z|(?i:.*?latest)', re.S)
+# Dummy values for required params; epoch/number take precedence over hash
+_PARAM_RE = re.compile(r'.*?(?P<number>epoch|number)|.*?(?P<hash>hash)', re.S)
+_PARAM_VALUES = {'number': "1", 'hash': "latest"}
+
 
 def parse_sse_response(response: requests.Response) -> Optional[dict]:
-    """Parse SSE response and extract JSON data."""
-    for line in response.iter_lines():
-        if line:
-            decoded = line.decode('utf-8')
-            if decoded.startswith('data: '):
-                return json.loads(decoded[6:])
-    return None
+    """Parse SSE response and extract JSON data.
+
+    Scans the raw stream incrementally for the first `data:` line, then reads
+    the (short) remainder of the body so the connection can go back to the
+    pool instead of being closed.
+    """
+    buf = bytearray()
+    data = None
+    try:
+        chunks = response.iter_content(chunk_size=4096)
+        for chunk in chunks:
+            buf += chunk
+            while (end := buf.find(b'\n')) >= 0:
+                line = buf[:end].rstrip(b'\r')
+                del buf[:end + 1]
+                if line.startswith(b'data: '):
+                    data = line[6:]
+                    break
+            if data is not None:
+                break
+        else:
+            if buf.startswith(b'data: '):
+                data = buf[6:].rstrip(b'\r')
+        for _ in chunks:
+            pass
+    finally:
+        response.close()
+    return json_loads(data) if data is not None else None
+
+
+def make_session(session_id: Optional[str] = None) -> requests.Session:
+    """Keep-alive session with the MCP headers (and session id, once known)."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(HEADERS)
+    if session_id:
+        session.headers['mcp-session-id'] = session_id
+    return session
+
+
+def post_sse(request: dict, timeout: int, session_id: Optional[str]) -> Optional[dict]:
+    """POST a JSON-RPC request and parse its SSE response.
+
+    Runs on worker threads, so it uses a Session of its own rather than
+    sharing one across threads.
+    """
+    with make_session(session_id) as session:
+        resp = session.post(MCP_URL, json=request, stream=True, timeout=timeout)
+        return parse_sse_response(resp)
 
 
 def test_mcp_server():
@@ -34,7 +95,8 @@ def test_mcp_server():
     print("Acropolis MCP Server Standalone Test")
     print("=" * 60)
     
-    session = requests.Session()
+    # One pooled keep-alive connection carries the sequential steps (1, 2, 5)
+    session = make_session()
     
     # Step 1: Initialize
     print("\n[1] Sending initialize request...")
@@ -50,7 +112,7 @@ def test_mcp_server():
     }
     
     try:
-        resp = session.post(MCP_URL, json=init_request, headers=HEADERS, stream=True, timeout=10)
+        resp = session.post(MCP_URL, json=init_request, stream=True, timeout=10)
         resp.raise_for_status()
     except requests.exceptions.ConnectionError:
         print("ERROR: Cannot connect to MCP server at", MCP_URL)
@@ -89,7 +151,7 @@ def test_mcp_server():
     # Step 2: Send initialized notification
     print("\n[2] Sending initialized notification...")
     if session_id:
-        HEADERS['mcp-session-id'] = session_id
+        session.headers['mcp-session-id'] = session_id
     
     init_notif = {
         "jsonrpc": "2.0",
@@ -97,25 +159,41 @@ def test_mcp_server():
     }
     
     try:
-        # Notification doesn't require response handling
-        session.post(MCP_URL, json=init_notif, headers=HEADERS, stream=True, timeout=10)
+        # Notification doesn't require response handling; reading the (empty)
+        # body lets the connection go back to the pool
+        session.post(MCP_URL, json=init_notif, timeout=10)
         # Notification may not return data, that's OK
         print("    OK (notification sent)")
     except Exception as e:
         print(f"    Warning: {e}")
     
-    # Step 3: List tools
-    print("\n[3] Requesting tools/list...")
+    # Steps 3 and 4 are independent once the session is initialized, so both
+    # requests are sent together (each worker with its own Session) and their
+    # results reported in order
     tools_request = {
         "jsonrpc": "2.0",
         "id": 2,
         "method": "tools/list",
         "params": {}
     }
+    resources_request = {
+        "jsonrpc": "2.0",
+        "id": 3,
+        "method": "resources/list",
+        "params": {}
+    }
     
+    executor = ThreadPoolExecutor(max_workers=2)
+    print("\n[3] Requesting tools/list...")
+    tools_future = executor.submit(post_sse, tools_request, 10, session_id)
+    print("\n[4] Requesting resources/list...")
+    resources_future = executor.submit(post_sse, resources_request, 10, session_id)
+    executor.shutdown(wait=False)
+    
+    # Step 3: List tools
+    print("\n[3] tools/list result:")
     try:
-        resp3 = session.post(MCP_URL, json=tools_request, headers=HEADERS, stream=True, timeout=10)
-        tools_response = parse_sse_response(resp3)
+        tools_response = tools_future.result()
         
         if not tools_response:
             print("ERROR: No response from tools/list")
@@ -139,17 +217,9 @@ def test_mcp_server():
         return False
     
     # Step 4: List resources
-    print("\n[4] Requesting resources/list...")
-    resources_request = {
-        "jsonrpc": "2.0",
-        "id": 3,
-        "method": "resources/list",
-        "params": {}
-    }
-    
+    print("\n[4] resources/list result:")
     try:
-        resp4 = session.post(MCP_URL, json=resources_request, headers=HEADERS, stream=True, timeout=10)
-        resources_response = parse_sse_response(resp4)
+        resources_response = resources_future.result()
         
         if resources_response and 'result' in resources_response:
             resources = resources_response.get('result', {}).get('resources', [])
@@ -171,7 +241,7 @@ def test_mcp_server():
         for tool in tools:
             name = tool.get('name', '')
             # Look for tools that don't require parameters
-            if 'latest' in name.lower() or name == 'get_epoch_info':
+            if _TOOL_HINT_RE.match(name):
                 test_tool = tool
                 break
         
@@ -188,12 +258,8 @@ def test_mcp_server():
         
         # Provide dummy values for required params
         for param in required:
-            if 'epoch' in param.lower() or 'number' in param.lower():
-                args[param] = "1"  # Use epoch 1 as test
-            elif 'hash' in param.lower():
-                args[param] = "latest"
-            else:
-                args[param] = "test"
+            m = _PARAM_RE.match(param.lower())
+            args[param] = _PARAM_VALUES[m.lastgroup] if m else "test"
         
         call_request = {
             "jsonrpc": "2.0",
@@ -206,7 +272,7 @@ def test_mcp_server():
         }
         
         try:
-            resp5 = session.post(MCP_URL, json=call_request, headers=HEADERS, stream=True, timeout=30)
+            resp5 = session.post(MCP_URL, json=call_request, stream=True, timeout=30)
             call_response = parse_sse_response(resp5)
             
             if call_response and 'result' in call_response:
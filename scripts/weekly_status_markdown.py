@@ -28,6 +28,12 @@ Output:
   - Prints Markdown to stdout
   - If GITHUB_STEP_SUMMARY is set, also writes to it.
   - If OUTPUT_PATH is set, also writes file to that path.
+
+Caching:
+  - State-based REST pages (no project, no labels) are revalidated with ETags
+    cached in ~/.cache/weekly_status_etags.json. This only helps local runs
+    without a project or labels: the Projects path makes no REST calls, and
+    CI does not persist ~/.cache.
 """
 
 # Suppress urllib3 warnings early
@@ -39,15 +45,52 @@ import os
 import sys
 import json
 import datetime as dt
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from urllib.parse import parse_qs, urlencode, urlparse
 from typing import List, Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(raw: bytes):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def json_dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode("utf-8")
 
 GITHUB_API = "https://api.github.com/graphql"
 REST_API   = "https://api.github.com"
 
+# Conditional-request cache for REST list pages: key -> {etag, items, links}.
+# Only the state-based (label-less, project-less) path uses it; see module doc
+ETAG_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "weekly_status_etags.json")
+ETAG_CACHE: Dict[str, dict] = {}
+# Keys requested during this run; only these are saved, so stale pages drop out
+ETAG_USED: set = set()
+
 def iso(d: dt.datetime) -> str:
     return d.replace(microsecond=0, tzinfo=dt.timezone.utc).isoformat().replace("+00:00", "Z")
 
+def parse_iso_ts(s: Optional[str]) -> Optional[float]:
+    if not s:
+        return None
+    return dt.datetime.fromisoformat(s.replace("Z","+00:00")).timestamp()
+
+def add_timestamps(item: dict) -> dict:
+    # Parse the ISO dates once at ingestion so the time-window filters only
+    # compare floats
+    item["closedTs"] = parse_iso_ts(item.get("closedAt"))
+    item["mergedTs"] = parse_iso_ts(item.get("mergedAt"))
+    item["updatedTs"] = parse_iso_ts(item.get("updatedAt"))
+    return item
+
 def previous_monday(d: dt.date) -> dt.date:
     return d - dt.timedelta(days=(d.weekday()))  # Monday is 0
 
@@ -60,119 +103,217 @@ def last_week_window(today: dt.date) -> Tuple[dt.datetime, dt.datetime]:
     end   = dt.datetime.combine(last_sunday, dt.time(23,59,59), tzinfo=dt.timezone.utc)
     return start, end
 
-def gh_graphql(token: str, query: str, variables: dict) -> dict:
-    r = requests.post(
+def make_session(token: Optional[str] = None) -> requests.Session:
+    """
+    Shared keep-alive session for all GitHub calls, so pagination loops reuse
+    one TLS connection. Transient gateway errors are retried with backoff
+    (GraphQL queries are read-only, so POST is safe to retry).
+    Sessions are not shared across threads; workers build their own with the
+    same settings (see gh_rest_pages).
+    """
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                  allowed_methods=frozenset({"GET", "POST"}), raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=10, max_retries=retry))
+    session.headers["Accept"] = "application/vnd.github+json"
+    if token:
+        session.headers["Authorization"] = f"Bearer {token}"
+    return session
+
+def gh_graphql(session: requests.Session, query: str, variables: dict) -> dict:
+    r = session.post(
         GITHUB_API,
-        headers={"Authorization": f"bearer {token}", "Accept": "application/vnd.github+json"},
-        json={"query": query, "variables": variables},
+        data=json_dumps({"query": query, "variables": variables}),
+        headers={"Content-Type": "application/json"},
         timeout=60,
     )
     r.raise_for_status()
-    data = r.json()
+    data = json_loads(r.content)
     if "errors" in data:
         raise RuntimeError(f"GitHub GraphQL errors: {data['errors']}")
     return data["data"]
 
-def gh_rest(token: str, url: str, params: dict=None) -> dict:
-    r = requests.get(
-        url,
-        headers={"Authorization": f"Bearer {token}", "Accept": "application/vnd.github+json"},
-        params=params or {},
-        timeout=60,
-    )
-    r.raise_for_status()
-    return r.json()
+# Only these fields of a REST issue are used; everything else is dropped
+ISSUE_FIELDS = ("title", "html_url", "number", "closed_at", "updated_at",
+                "created_at", "state", "pull_request")
 
-def discover_projects(token: str, owner: str) -> List[dict]:
+def decode_list(r: requests.Response, fields: Tuple[str, ...]) -> List[dict]:
     """
-    Discover available GitHub Projects v2 for the given owner (org or user).
-    Returns list of {number, title} dicts.
+    Decode a JSON array response keeping only `fields` of each element, so
+    bodies, users, labels, reactions, ... are not held on to.
     """
-    query = """
-    query($owner: String!) {
-      organization(login: $owner) {
-        projectsV2(first: 20) {
-          nodes { number title }
-        }
+    return [{k: it[k] for k in fields if k in it} for it in json_loads(r.content)]
+
+def load_etag_cache() -> None:
+    try:
+        with open(ETAG_CACHE_PATH, encoding="utf-8") as f:
+            ETAG_CACHE.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+def save_etag_cache() -> None:
+    if not ETAG_USED:
+        return  # no REST requests this run; leave the file alone
+    try:
+        os.makedirs(os.path.dirname(ETAG_CACHE_PATH), exist_ok=True)
+        with open(ETAG_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({k: ETAG_CACHE[k] for k in ETAG_USED if k in ETAG_CACHE}, f)
+    except OSError as e:
+        print(f"[warn] Failed to save ETag cache: {e}", file=sys.stderr)
+
+def gh_rest_list(session: requests.Session, url: str, params: dict,
+                 fields: Tuple[str, ...]) -> Tuple[List[dict], dict]:
+    """
+    GET one page of a REST list endpoint. Returns (items, links).
+    Pages seen on a previous run are revalidated with If-None-Match; a 304
+    reuses the cached items without transferring the body.
+    """
+    key = f"{url}?{urlencode(sorted(params.items()))}#{','.join(fields)}"
+    cached = ETAG_CACHE.get(key)
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+    ETAG_USED.add(key)
+
+    with session.get(url, params=params, headers=headers, timeout=60) as r:
+        if r.status_code == 304 and cached:
+            return list(cached["items"]), cached["links"]
+        r.raise_for_status()
+        items = decode_list(r, fields)
+        links = r.links
+        etag = r.headers.get("ETag")
+
+    if etag:
+        ETAG_CACHE[key] = {"etag": etag, "items": list(items), "links": links}
+    return items, links
+
+def gh_rest_pages(session: requests.Session, url: str, params: dict=None,
+                  fields: Tuple[str, ...]=ISSUE_FIELDS) -> List[dict]:
+    """
+    Fetch all pages of a REST list endpoint. The first page's Link header
+    tells how many pages there are; the remaining ones are fetched concurrently
+    and concatenated in page order. requests.Session is not documented as
+    thread-safe, so each worker thread uses its own keep-alive session carrying
+    the caller's headers.
+    """
+    params = dict(params or {}, page=1)
+    items, links = gh_rest_list(session, url, params, fields)
+
+    last_url = links.get("last", {}).get("url")
+    if not last_url:
+        return items
+    last_page = int(parse_qs(urlparse(last_url).query)["page"][0])
+
+    local = threading.local()
+    worker_sessions = []
+
+    def fetch(page: int) -> List[dict]:
+        s = getattr(local, "session", None)
+        if s is None:
+            s = local.session = make_session()
+            s.headers.update(session.headers)
+            worker_sessions.append(s)
+        return gh_rest_list(s, url, dict(params, page=page), fields)[0]
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            for res in ex.map(fetch, range(2, last_page + 1)):
+                items.extend(res)
+    finally:
+        for s in worker_sessions:
+            s.close()
+    return items
+
+# Project id plus the field definitions needed to locate the Status field
+PROJECT_FIELDS_FRAGMENT = """
+fragment ProjectFields on ProjectV2 {
+  id
+  fields(first: 50) {
+    nodes {
+      ... on ProjectV2FieldCommon {
+        id
+        name
+        dataType
       }
-      user(login: $owner) {
-        projectsV2(first: 20) {
-          nodes { number title }
-        }
+      ... on ProjectV2SingleSelectField {
+        id
+        name
+        dataType
+        options { id name }
       }
     }
+  }
+}
+"""
+
+def discover_projects(session: requests.Session, owner: str, number: Optional[int] = None,
+                      with_fields: bool = False) -> Tuple[List[dict], Optional[Tuple[str, str, Dict[str,str]]]]:
     """
+    Discover available GitHub Projects v2 for the given owner (org or user).
+    Returns (list of {number, title} dicts, status field info as returned by
+    get_project_and_status_field or None).
+    With `with_fields`, the fields of project `number` (or of the first
+    project when no number is given) come back in the same request, so the
+    caller needs no second round-trip to look them up.
+    """
+    if not with_fields:
+        proj_sel = ""
+    elif number is None:
+        proj_sel = """
+        selected: projectsV2(first: 1) {
+          nodes { ...ProjectFields }
+        }"""
+    else:
+        proj_sel = """
+        selectedProject: projectV2(number: $number) { ...ProjectFields }"""
+    var_decl = ", $number: Int!" if with_fields and number is not None else ""
+    query = f"""
+    query($owner: String!{var_decl}) {{
+      organization(login: $owner) {{
+        projectsV2(first: 20) {{
+          nodes {{ number title }}
+        }}{proj_sel}
+      }}
+      user(login: $owner) {{
+        projectsV2(first: 20) {{
+          nodes {{ number title }}
+        }}{proj_sel}
+      }}
+    }}
+    """ + (PROJECT_FIELDS_FRAGMENT if with_fields else "")
+    variables = {"owner": owner}
+    if var_decl:
+        variables["number"] = number
     try:
-        data = gh_graphql(token, query, {"owner": owner})
+        data = gh_graphql(session, query, variables)
         projects = []
+        selected = []
         
-        # Try org projects first
-        org_projects = data.get("organization", {})
-        if org_projects and org_projects.get("projectsV2"):
-            projects.extend(org_projects["projectsV2"]["nodes"] or [])
-        
-        # Try user projects
-        user_projects = data.get("user", {})
-        if user_projects and user_projects.get("projectsV2"):
-            projects.extend(user_projects["projectsV2"]["nodes"] or [])
+        # Try org projects first, then user projects
+        for kind in ("organization", "user"):
+            owner_data = data.get(kind) or {}
+            if owner_data.get("projectsV2"):
+                projects.extend(owner_data["projectsV2"]["nodes"] or [])
+            if owner_data.get("selected"):
+                selected.extend(owner_data["selected"]["nodes"] or [])
+            if owner_data.get("selectedProject"):
+                selected.append(owner_data["selectedProject"])
         
-        return [p for p in projects if p]  # filter out nulls
+        selected = [p for p in selected if p]
+        fields = None
+        if selected:
+            try:
+                fields = parse_project_fields(selected[0])
+            except RuntimeError:
+                pass
+        return [p for p in projects if p], fields  # filter out nulls
     except Exception as e:
         print(f"[warn] Failed to discover projects for {owner}: {e}", file=sys.stderr)
-        return []
+        return [], None
 
-def get_project_and_status_field(token: str, owner: str, number: int) -> Tuple[str, str, Dict[str,str]]:
+def parse_project_fields(proj: dict) -> Tuple[str, str, Dict[str,str]]:
     """
     Returns (projectId, statusFieldId, statusOptionsMap{name->optionId})
+    from a project selected with the ProjectFields fragment.
     """
-    query = """
-    query($owner: String!, $number: Int!) {
-      organization(login: $owner) {
-        projectV2(number: $number) {
-          id
-          fields(first: 50) {
-            nodes {
-              ... on ProjectV2FieldCommon {
-                id
-                name
-                dataType
-              }
-              ... on ProjectV2SingleSelectField {
-                id
-                name
-                dataType
-                options { id name }
-              }
-            }
-          }
-        }
-      }
-      user(login: $owner) {
-        projectV2(number: $number) {
-          id
-          fields(first: 50) {
-            nodes {
-              ... on ProjectV2FieldCommon {
-                id
-                name
-                dataType
-              }
-              ... on ProjectV2SingleSelectField {
-                id
-                name
-                dataType
-                options { id name }
-              }
-            }
-          }
-        }
-      }
-    }
-    """
-    data = gh_graphql(token, query, {"owner": owner, "number": number})
-    proj = data.get("organization", {}).get("projectV2") or data.get("user", {}).get("projectV2")
-    if not proj:
-        raise RuntimeError("Project not found (check PROJECT_OWNER/PROJECT_NUMBER).")
     project_id = proj["id"]
 
     status_field = None
@@ -187,19 +328,51 @@ def get_project_and_status_field(token: str, owner: str, number: int) -> Tuple[s
         raise RuntimeError("Status field not found on the project.")
     return project_id, status_field, status_options
 
-def items_by_status_from_project(token: str, owner: str, number: int,
+def get_project_and_status_field(session: requests.Session, owner: str, number: int) -> Tuple[str, str, Dict[str,str]]:
+    """
+    Returns (projectId, statusFieldId, statusOptionsMap{name->optionId})
+    """
+    query = """
+    query($owner: String!, $number: Int!) {
+      organization(login: $owner) {
+        projectV2(number: $number) { ...ProjectFields }
+      }
+      user(login: $owner) {
+        projectV2(number: $number) { ...ProjectFields }
+      }
+    }
+    """ + PROJECT_FIELDS_FRAGMENT
+    data = gh_graphql(session, query, {"owner": owner, "number": number})
+    proj = (data.get("organization") or {}).get("projectV2") or (data.get("user") or {}).get("projectV2")
+    if not proj:
+        raise RuntimeError("Project not found (check PROJECT_OWNER/PROJECT_NUMBER).")
+    return parse_project_fields(proj)
+
+def items_by_status_from_project(session: requests.Session, owner: str, number: int,
                                  wanted_status_names: List[str],
-                                 repo_fullname: str) -> Dict[str, List[dict]]:
+                                 repo_fullname: str,
+                                 project: Optional[Tuple[str, str, Dict[str,str]]] = None,
+                                 updated_after: Optional[Dict[str, float]] = None) -> Dict[str, List[dict]]:
     """
     Returns map {statusName: [ {title,url,number,updatedAt,closedAt,type} ]}
-    filtered to the specified repo.
+    filtered to the specified repo. `project` is the already-fetched
+    get_project_and_status_field result, if the caller has it.
+    `updated_after` maps a status name to an epoch-seconds bound: items in
+    that status last updated at or before it are dropped before their content
+    is fetched. (Project items can only be ordered by position, so the
+    pagination itself cannot stop early.)
     """
-    project_id, status_field_id, status_options = get_project_and_status_field(token, owner, number)
+    updated_after = updated_after or {}
+    if project is None:
+        project = get_project_and_status_field(session, owner, number)
+    project_id, status_field_id, status_options = project
     wanted_option_ids = [status_options[n] for n in wanted_status_names if n in status_options]
 
     results = {n: [] for n in wanted_status_names}
+    option_names = {oid: name for name, oid in status_options.items()}
 
-    # Paginate through project items
+    # Phase 1: paginate through project items fetching only their Status
+    # value; item content is requested later for the matching items only
     query = """
     query($projectId: ID!, $after: String) {
       node(id: $projectId) {
@@ -207,30 +380,13 @@ def items_by_status_from_project(token: str, owner: str, number: int,
           items(first: 100, after: $after) {
             pageInfo { hasNextPage endCursor }
             nodes {
+              id
               updatedAt
-              content {
-                __typename
-                ... on Issue {
-                  number
-                  title
-                  url
-                  repository { nameWithOwner }
-                  closedAt
-                }
-                ... on PullRequest {
-                  number
-                  title
-                  url
-                  repository { nameWithOwner }
-                  mergedAt
-                  closedAt
-                }
-              }
               fieldValues(first: 20) {
                 nodes {
                   __typename
                   ... on ProjectV2ItemFieldSingleSelectValue {
-                    field { ... on ProjectV2SingleSelectField { id name } }
+                    field { ... on ProjectV2SingleSelectField { id } }
                     optionId
                   }
                 }
@@ -241,9 +397,10 @@ def items_by_status_from_project(token: str, owner: str, number: int,
       }
     }
     """
+    matched = []  # (itemId, updatedAt, statusName)
     after = None
     while True:
-        data = gh_graphql(token, query, {"projectId": project_id, "after": after})
+        data = gh_graphql(session, query, {"projectId": project_id, "after": after})
         items = data["node"]["items"]["nodes"]
         for it in items:
             # find the Status value (optionId)
@@ -256,138 +413,188 @@ def items_by_status_from_project(token: str, owner: str, number: int,
             if option_id not in wanted_option_ids:
                 continue
 
-            content = it.get("content") or {}
+            results_key = option_names.get(option_id)
+            if not results_key:
+                continue
+            cutoff = updated_after.get(results_key)
+            if cutoff is not None:
+                t = parse_iso_ts(it["updatedAt"])
+                if t is None or t <= cutoff:
+                    continue
+            matched.append((it["id"], it["updatedAt"], results_key))
+
+        pi = data["node"]["items"]["pageInfo"]
+        if not pi["hasNextPage"]:
+            break
+        after = pi["endCursor"]
+
+    # Phase 2: fetch content for the matching items in batches
+    details_query = """
+    query($ids: [ID!]!) {
+      nodes(ids: $ids) {
+        ... on ProjectV2Item {
+          content {
+            __typename
+            ... on Issue {
+              number
+              title
+              url
+              repository { nameWithOwner }
+              closedAt
+            }
+            ... on PullRequest {
+              number
+              title
+              url
+              repository { nameWithOwner }
+              mergedAt
+              closedAt
+            }
+          }
+        }
+      }
+    }
+    """
+    for start in range(0, len(matched), 50):
+        batch = matched[start:start + 50]
+        data = gh_graphql(session, details_query, {"ids": [item_id for item_id, _, _ in batch]})
+        for (_, updatedAt, results_key), node in zip(batch, data["nodes"]):
+            content = (node or {}).get("content") or {}
             typename = content.get("__typename")
             if typename not in ("Issue", "PullRequest"):
                 continue
             if content["repository"]["nameWithOwner"].lower() != repo_fullname.lower():
                 continue
 
-            closedAt = content.get("closedAt")
-            mergedAt = content.get("mergedAt")
-            updatedAt = it["updatedAt"]
-
-            results_key = None
-            for name, oid in status_options.items():
-                if oid == option_id:
-                    results_key = name
-                    break
-            if not results_key:
-                continue
-
-            results[results_key].append({
+            results[results_key].append(add_timestamps({
                 "type": typename,
                 "title": content["title"],
                 "url": content["url"],
                 "number": content["number"],
-                "closedAt": closedAt,
-                "mergedAt": mergedAt,
+                "closedAt": content.get("closedAt"),
+                "mergedAt": content.get("mergedAt"),
                 "updatedAt": updatedAt,
-            })
-
-        pi = data["node"]["items"]["pageInfo"]
-        if not pi["hasNextPage"]:
-            break
-        after = pi["endCursor"]
+            }))
 
     return results
 
-def search_by_labels(token: str, repo: str, labels: List[str]) -> List[dict]:
+def search_by_labels(session: requests.Session, repo: str, labels: List[str],
+                     updated_since: dt.datetime) -> List[dict]:
     """
-    Simple REST search for issues with any of the labels.
+    Issues/PRs carrying any of the labels and updated since `updated_since`,
+    via one GraphQL search (GitHub ORs comma-separated label values
+    server-side, so no client de-dup is needed). Search returns at most 1000
+    results, so the date bound is what keeps the result set complete.
+    """
+    query = """
+    query($q: String!, $after: String) {
+      search(query: $q, type: ISSUE, first: 100, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          __typename
+          ... on Issue {
+            number
+            title
+            url
+            closedAt
+            updatedAt
+          }
+          ... on PullRequest {
+            number
+            title
+            url
+            closedAt
+            mergedAt
+            updatedAt
+          }
+        }
+      }
+    }
     """
+    q = f"repo:{repo} label:" + ",".join(f'"{lab}"' for lab in labels) + \
+        f" updated:>={iso(updated_since)}"
+
     items = []
-    for lab in labels:
-        page = 1
-        while True:
-            res = gh_rest(token, f"{REST_API}/repos/{repo}/issues",
-                          params={"state": "all", "labels": lab, "per_page": 100, "page": page})
-            if not res:
-                break
-            for it in res:
-                # Skip pull-request-only stubs unless desired; GitHub REST issues may include PRs
-                title = it["title"]
-                url = it["html_url"]
-                num = it["number"]
-                closedAt = it.get("closed_at")
-                updatedAt = it.get("updated_at")
-                is_pr = "pull_request" in it
-                items.append({
-                    "type": "PullRequest" if is_pr else "Issue",
-                    "title": title, "url": url, "number": num,
-                    "closedAt": closedAt, "mergedAt": None, "updatedAt": updatedAt
-                })
-            if len(res) < 100:
-                break
-            page += 1
-    # de-dup by number
-    seen = {}
-    for x in items:
-        seen[x["number"]] = x
-    return list(seen.values())
-
-def get_recent_issues_by_state(token: str, repo: str, state: str = "all", days: int = 7) -> List[dict]:
+    after = None
+    while True:
+        data = gh_graphql(session, query, {"q": q, "after": after})
+        for it in data["search"]["nodes"]:
+            typename = it.get("__typename")
+            if typename not in ("Issue", "PullRequest"):
+                continue
+            items.append(add_timestamps({
+                "type": typename,
+                "title": it["title"], "url": it["url"], "number": it["number"],
+                "closedAt": it.get("closedAt"), "mergedAt": it.get("mergedAt"),
+                "updatedAt": it.get("updatedAt")
+            }))
+        pi = data["search"]["pageInfo"]
+        if not pi["hasNextPage"]:
+            break
+        after = pi["endCursor"]
+    return items
+
+def get_recent_issues_by_state(session: requests.Session, repo: str, state: str = "all", days: int = 7) -> List[dict]:
     """
     Fetch recent issues/PRs from the repo by state (open/closed/all).
     More targeted approach when labels aren't well organized.
     """
     items = []
-    page = 1
     
-    # Calculate the date threshold
+    # Calculate the date threshold. With ETags cached by an earlier run it is
+    # rounded down to the day (widening the window by up to a day), so that
+    # runs on the same day send identical requests and can revalidate pages
     since_date = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=days)
-    since_iso = since_date.isoformat().replace('+00:00', 'Z')
+    if ETAG_CACHE:
+        since_iso = iso(since_date.replace(hour=0, minute=0, second=0))
+    else:
+        since_iso = since_date.isoformat().replace('+00:00', 'Z')
     
-    while True:
-        params = {
-            "state": state,
-            "per_page": 100,
-            "page": page,
-            "sort": "updated",
-            "direction": "desc",
-            "since": since_iso
-        }
+    params = {
+        "state": state,
+        "per_page": 100,
+        "sort": "updated",
+        "direction": "desc",
+        "since": since_iso
+    }
+    
+    res = gh_rest_pages(session, f"{REST_API}/repos/{repo}/issues", params=params)
+    for it in res:
+        title = it["title"]
+        url = it["html_url"]
+        num = it["number"]
+        closedAt = it.get("closed_at")
+        updatedAt = it.get("updated_at")
+        createdAt = it.get("created_at")
+        state_val = it.get("state")
+        is_pr = "pull_request" in it
         
-        res = gh_rest(token, f"{REST_API}/repos/{repo}/issues", params=params)
-        if not res:
-            break
-            
-        for it in res:
-            title = it["title"]
-            url = it["html_url"]
-            num = it["number"]
-            closedAt = it.get("closed_at")
-            updatedAt = it.get("updated_at")
-            createdAt = it.get("created_at")
-            state_val = it.get("state")
-            is_pr = "pull_request" in it
-            
-            items.append({
-                "type": "PullRequest" if is_pr else "Issue",
-                "title": title, 
-                "url": url, 
-                "number": num,
-                "closedAt": closedAt, 
-                "mergedAt": None, 
-                "updatedAt": updatedAt,
-                "createdAt": createdAt,
-                "state": state_val
-            })
-            
-        if len(res) < 100:
-            break
-        page += 1
+        items.append(add_timestamps({
+            "type": "PullRequest" if is_pr else "Issue",
+            "title": title, 
+            "url": url, 
+            "number": num,
+            "closedAt": closedAt, 
+            "mergedAt": None, 
+            "updatedAt": updatedAt,
+            "createdAt": createdAt,
+            "state": state_val
+        }))
     
     return items
 
-def format_markdown(done_items: List[dict], inprog_items: List[dict]) -> str:
+def format_markdown(done_items: List[dict], inprog_items: List[dict]) -> bytes:
+    """
+    Returns the report as UTF-8 bytes, ready to be written to every output.
+    """
     def fmt(items: List[dict]) -> str:
         if not items:
             return "_(none)_"
-        # sort by updatedAt desc
-        items = sorted(items, key=lambda x: x.get("updatedAt") or "", reverse=True)
+        # sort by updatedAt desc; missing values sort last
+        keyed = [(it.get("updatedAt") or "", it) for it in items]
+        keyed.sort(key=itemgetter(0), reverse=True)
         lines = []
-        for it in items:
+        for _, it in keyed:
             t = "PR" if it["type"] == "PullRequest" else "Issue"
             lines.append(f"- [{t} #{it['number']}]({it['url']}) — {it['title']}")
         return "\n".join(lines)
@@ -405,7 +612,7 @@ def format_markdown(done_items: List[dict], inprog_items: List[dict]) -> str:
     md.append("")
     md.append(right)
 
-    return "\n".join(md)
+    return "\n".join(md).encode("utf-8")
 
 def main():
     token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
@@ -414,9 +621,16 @@ def main():
         print("Missing GH_TOKEN/GITHUB_TOKEN or REPO (e.g., 'input-output-hk/acropolis')", file=sys.stderr)
         sys.exit(2)
 
+    session = make_session(token)
+    load_etag_cache()
+
     # time windows
     today = dt.datetime.now(dt.timezone.utc).date()
     last_start, last_end = last_week_window(today)
+    now_ts = dt.datetime.now(dt.timezone.utc).timestamp()
+    plans_days = 7
+    # Plans only keep items updated within the last plans_days whole days
+    plans_cutoff = now_ts - (plans_days + 1) * 86400
 
     status_done_val  = os.environ.get("STATUS_DONE_VALUE", "Done")
     status_ip_val    = os.environ.get("STATUS_INPROGRESS_VALUE", "In Progress")
@@ -426,13 +640,18 @@ def main():
 
     proj_owner   = os.environ.get("PROJECT_OWNER")
     proj_number  = os.environ.get("PROJECT_NUMBER")
+    project      = None  # status field info, when discovery already fetched it
 
     # Auto-discover projects if not specified
     if not proj_owner or not proj_number:
         # Try the repo owner first
         repo_owner = repo.split('/')[0]
         print(f"[info] No project specified, discovering projects for {repo_owner}...", file=sys.stderr)
-        projects = discover_projects(token, repo_owner)
+        # When the project will be owned by repo_owner, fetch its Status field
+        # (the given number, or the auto-selected first project) in the same query
+        number = int(proj_number) if proj_number and proj_number.isdigit() else None
+        with_fields = proj_owner in (None, "", repo_owner) and (not proj_number or number is not None)
+        projects, discovered = discover_projects(session, repo_owner, number, with_fields=with_fields)
         
         if projects:
             print(f"[info] Found {len(projects)} projects:", file=sys.stderr)
@@ -445,6 +664,8 @@ def main():
             if not proj_number:
                 proj_number = str(projects[0]['number'])
                 print(f"[info] Auto-selecting project {proj_number}: {projects[0]['title']}", file=sys.stderr)
+            if proj_owner == repo_owner:
+                project = discovered
         else:
             print(f"[info] No projects found for {repo_owner}", file=sys.stderr)
 
@@ -454,9 +675,12 @@ def main():
         try:
             print(f"[info] Attempting to use GitHub Project: owner={proj_owner}, number={proj_number}", file=sys.stderr)
             buckets = items_by_status_from_project(
-                token, proj_owner, int(proj_number),
+                session, proj_owner, int(proj_number),
                 [status_done_val, status_ip_val],
-                repo_fullname=repo
+                repo_fullname=repo,
+                project=project,
+                # Stale in-progress items can't make it into the plans
+                updated_after={status_ip_val: plans_cutoff} if status_ip_val != status_done_val else None
             )
             done_items = buckets.get(status_done_val, [])
             inprog_items = buckets.get(status_ip_val, [])
@@ -476,60 +700,63 @@ def main():
         
         if done_labels or ip_labels:
             # Use label-based approach if labels are specified
-            done_items  = search_by_labels(token, repo, done_labels) if done_labels else []
-            inprog_items= search_by_labels(token, repo, ip_labels) if ip_labels else []
+            # Closing or merging bumps updatedAt, so anything closed last week
+            # was updated since last_start; plans only look back to plans_cutoff
+            plans_since = dt.datetime.fromtimestamp(plans_cutoff, dt.timezone.utc)
+            done_items  = search_by_labels(session, repo, done_labels, last_start) if done_labels else []
+            inprog_items= search_by_labels(session, repo, ip_labels, plans_since) if ip_labels else []
         else:
             # Fallback: use state-based approach 
             print("[info] No specific labels configured, using state-based filtering", file=sys.stderr)
             
             # Get all recent issues from the last 14 days for broader context
-            all_recent = get_recent_issues_by_state(token, repo, state="all", days=14)
+            all_recent = get_recent_issues_by_state(session, repo, state="all", days=14)
             
             # Split into done (closed) and in-progress (open) items
             done_items = [it for it in all_recent if it.get("state") == "closed"]
             inprog_items = [it for it in all_recent if it.get("state") == "open"]
 
+    save_etag_cache()
+
     # Filter by time windows
+    last_start_ts, last_end_ts = last_start.timestamp(), last_end.timestamp()
+
     def closed_last_week(it: dict) -> bool:
         # For achievements: closed/merged in the last week
-        for k in ("mergedAt", "closedAt"):
-            v = it.get(k)
-            if not v:
-                continue
-            t = dt.datetime.fromisoformat(v.replace("Z","+00:00"))
-            if last_start <= t <= last_end:
+        for k in ("mergedTs", "closedTs"):
+            t = it.get(k)
+            if t is not None and last_start_ts <= t <= last_end_ts:
                 return True
         return False
 
-    def updated_recent(it: dict, days=7) -> bool:
-        # For in-progress: updated in the last week
-        v = it.get("updatedAt")
-        if not v:
+    def updated_recent(it: dict) -> bool:
+        # For in-progress: updated in the last week (whole days elapsed <= plans_days)
+        t = it.get("updatedTs")
+        if t is None:
             return False
-        t = dt.datetime.fromisoformat(v.replace("Z","+00:00"))
-        return (dt.datetime.now(dt.timezone.utc) - t).days <= days
+        return t > plans_cutoff
 
     # Achievements: items that were closed in the last week
     achievements = [it for it in done_items if closed_last_week(it)]
     
     # Plans: open items that were updated in the last week (showing active work)
-    plans = [it for it in inprog_items if it.get("state") == "open" and updated_recent(it, days=7)]
+    plans = [it for it in inprog_items if it.get("state") == "open" and updated_recent(it)]
 
     md = format_markdown(achievements, plans)
 
-    # Print and optionally write outputs
-    print(md)
+    # Print and optionally write outputs, each with a single write
+    sys.stdout.flush()
+    sys.stdout.buffer.write(md + b"\n")
+    sys.stdout.buffer.flush()
     step_summary = os.environ.get("GITHUB_STEP_SUMMARY")
     if step_summary:
-        with open(step_summary, "a", encoding="utf-8") as f:
-            f.write("\n\n## Weekly Status (auto-generated)\n")
-            f.write(md)
-            f.write("\n")
+        with open(step_summary, "ab") as f:
+            f.write(b"\n\n## Weekly Status (auto-generated)\n" + md + b"\n")
 
     out_path = os.environ.get("OUTPUT_PATH")
     if out_path:
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
-        with open(out_path, "w", encoding="utf-8") as f:
+        with open(out_path, "wb") as f:
             f.write(md)
 
 if __name__ == "__main__":